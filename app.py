@@ -1,15 +1,117 @@
 import requests
+from requests.adapters import HTTPAdapter
+import functools
 import os
+import posixpath
 import re
-from typing import Optional, Dict, Any
-import json
-from ftplib import FTP
+from typing import Optional, Dict, Any, Callable, Deque, Iterator, Set, Tuple
+import orjson
+import queue
+import tarfile
+import tempfile
+import threading
+import time
+import uuid
+from ftplib import FTP, error_perm
 from dotenv import load_dotenv
 import shutil  # Add this import for directory removal
+from concurrent.futures import Future, ThreadPoolExecutor
+from collections import deque
+from contextlib import contextmanager
 from flask import Flask, request, jsonify
 
 load_dotenv()
 
+# Number of parallel Range requests used to download a release asset
+DOWNLOAD_PARTS = 8
+# Number of concurrent FTP sessions used to upload release files
+FTP_UPLOAD_WORKERS = max(int(os.getenv("FTP_UPLOAD_WORKERS", "4")), 1)
+# Seconds before a blocking FTP operation is abandoned
+FTP_TIMEOUT = float(os.getenv("FTP_TIMEOUT", "60"))
+# Read size for streamed downloads
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+# Read size for streamed tar archives. tarfile re-slices its buffer on
+# every read, so sizes much above 64 KiB get slower, not faster.
+TAR_STREAM_BUFSIZE = 64 << 10
+# Minimum number of seconds between progress updates
+PROGRESS_INTERVAL = 0.1
+# Release ETags, payloads and deployed releases, kept across requests
+RELEASE_STATE_FILE = os.getenv("RELEASE_STATE_FILE", "./downloads/release_state.json")
+# Archive members larger than this are buffered on disk instead of in memory.
+# Up to 3 * FTP_UPLOAD_WORKERS + 1 members are buffered at once per job.
+SPOOL_MAX_SIZE = 1 << 20
+
+_release_state_lock = threading.Lock()
+# Release asset names: release-*.tar.gz or release-*.tar.zst
+RELEASE_ASSET_RE = re.compile(r"^release-.*\.tar\.(?:gz|zst)$")
+
+
+def preallocate_file(fd: int, size: int) -> None:
+    """
+    Reserve disk space for a file that is about to be written sequentially
+
+    Falls back to a sparse ftruncate where posix_fallocate is unavailable
+    or unsupported by the filesystem.
+
+    Args:
+        fd (int): File descriptor opened for writing
+        size (int): Final file size in bytes
+    """
+    if size <= 0:
+        return
+    try:
+        os.posix_fallocate(fd, 0, size)
+    except (AttributeError, OSError):
+        os.ftruncate(fd, size)
+    if hasattr(os, "posix_fadvise"):
+        os.posix_fadvise(fd, 0, size, os.POSIX_FADV_SEQUENTIAL)
+
+
+def release_page_cache(fd: int) -> None:
+    """
+    Tell the kernel a written file is not going to be read back soon
+
+    The data is synced first, since the kernel keeps dirty pages cached
+    regardless of the advice.
+
+    Args:
+        fd (int): File descriptor of the written file
+    """
+    if hasattr(os, "posix_fadvise"):
+        os.fdatasync(fd)
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+
+
+class ProgressReader:
+    """
+    Read-only stream wrapper that prints download progress
+    """
+
+    def __init__(self, raw: Any, total_size: int):
+        """
+        Initialize the reader
+
+        Args:
+            raw: Underlying binary stream
+            total_size (int): Expected number of bytes, 0 if unknown
+        """
+        self.raw = raw
+        self.total_size = total_size
+        self.downloaded_size = 0
+        self.last_report = time.monotonic()
+
+    def read(self, size: int = -1) -> bytes:
+        data = self.raw.read(size)
+        self.downloaded_size += len(data)
+
+        # Show download progress
+        now = time.monotonic()
+        if self.total_size > 0 and now - self.last_report > PROGRESS_INTERVAL:
+            self.last_report = now
+            progress = (self.downloaded_size / self.total_size) * 100
+            print(f"\rProgress: {progress:.1f}%%", end="")
+        return data
+
 
 class GitHubReleaseDownloader:
     """
@@ -37,30 +139,116 @@ class GitHubReleaseDownloader:
             self.headers["Authorization"] = f"Bearer {self.token}"
         self.last_error: Optional[str] = None
 
+        # One pooled keep-alive session shared by API calls and downloads
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_connections=DOWNLOAD_PARTS, pool_maxsize=DOWNLOAD_PARTS)
+        self.session.mount("https://", adapter)
+        # Release payload shared by the download, extract and upload phases
+        self._cached_release: Optional[Dict[str, Any]] = None
+        self._cached_asset: Optional[Dict[str, Any]] = None
+
     def _set_error(self, message: str) -> None:
         self.last_error = message
         print(message)
     
+    def _load_release_state(self) -> Dict[str, Any]:
+        """
+        Load the persisted release state of this repository
+
+        Returns:
+            Dict: State with optional "etag", "release" and "deployed" keys,
+            the latter mapping remote directories to the uploaded release
+        """
+        with _release_state_lock:
+            try:
+                with open(RELEASE_STATE_FILE, "rb") as file:
+                    return orjson.loads(file.read()).get(self.repo_name, {})
+            except (OSError, ValueError):
+                return {}
+
+    def _update_release_state(self, update: Callable[[Dict[str, Any]], None]) -> None:
+        """
+        Update and persist the release state of this repository
+
+        Args:
+            update (Callable): Mutates the repository state in place
+        """
+        with _release_state_lock:
+            try:
+                with open(RELEASE_STATE_FILE, "rb") as file:
+                    state = orjson.loads(file.read())
+            except (OSError, ValueError):
+                state = {}
+
+            update(state.setdefault(self.repo_name, {}))
+
+            try:
+                os.makedirs(os.path.dirname(RELEASE_STATE_FILE) or ".", exist_ok=True)
+                tmp_path = f"{RELEASE_STATE_FILE}.tmp"
+                with open(tmp_path, "wb") as file:
+                    file.write(orjson.dumps(state))
+                os.replace(tmp_path, RELEASE_STATE_FILE)
+            except OSError as e:
+                print(f"Error saving release state: {e}")
+
     def get_latest_release(self) -> Optional[Dict[str, Any]]:
         """
         Get information about the latest release
+
+        The payload is fetched once per downloader instance and reused by
+        subsequent calls. Requests are conditional on the ETag of the last
+        payload, which is reused when GitHub answers 304 Not Modified.
         
         Returns:
             Dict: Release information or None if error
         """
+        if self._cached_release is not None:
+            return self._cached_release
+
         url = f"{self.base_url}/repos/{self.repo_name}/releases/latest"
+        state = self._load_release_state()
+        headers = {}
+        if state.get("etag") and state.get("release"):
+            headers["If-None-Match"] = state["etag"]
         
         try:
-            response = requests.get(url, headers=self.headers)
+            response = self.session.get(url, headers=headers)
+            if response.status_code == 304:
+                self._cached_release = state["release"]
+                return self._cached_release
+
             response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
+            self._cached_release = orjson.loads(response.content)
+            if response.headers.get("ETag"):
+                etag = response.headers["ETag"]
+                self._update_release_state(lambda entry: entry.update(etag=etag, release=self._cached_release))
+            return self._cached_release
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
             self._set_error(f"Error getting release information: {e}")
             return None
-    
+
+    def is_deployed(self, remote_path: str) -> bool:
+        """
+        Check whether the latest release was already uploaded to a remote directory
+
+        Args:
+            remote_path (str): Remote directory on the FTP server
+
+        Returns:
+            bool: True if the latest release asset was uploaded there before
+        """
+        release_data = self.get_latest_release()
+        asset = release_data and self.find_release_asset(release_data)
+        if not asset:
+            return False
+
+        deployed = self._load_release_state().get("deployed", {}).get(remote_path)
+        return deployed == {"tag_name": release_data["tag_name"], "asset_id": asset["id"]}
+
     def find_release_asset(self, release_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
-        Find file with pattern release-*.tar.gz
+        Find file with pattern release-*.tar.gz or release-*.tar.zst
         
         Args:
             release_data (Dict): Release information
@@ -68,14 +256,17 @@ class GitHubReleaseDownloader:
         Returns:
             Dict: File information or None
         """
-        assets = release_data.get("assets", [])
-        pattern = re.compile(r"^release-.*\.tar\.gz$")
+        # The asset of the cached release is looked up only once
+        if release_data is self._cached_release and self._cached_asset is not None:
+            return self._cached_asset
 
-        for asset in assets:
-            if pattern.match(asset["name"]):
-                return asset
-        
-        self._set_error("No file found with pattern release-*.tar.gz")
+        asset = next((a for a in release_data.get("assets", ()) if RELEASE_ASSET_RE.match(a["name"])), None)
+        if asset is not None:
+            if release_data is self._cached_release:
+                self._cached_asset = asset
+            return asset
+
+        self._set_error("No file found with pattern release-*.tar.gz or release-*.tar.zst")
         return None
     
     def download_file(self, download_url: str, filename: str, download_path: str = "./downloads", use_api_url: bool = False) -> bool:
@@ -99,26 +290,30 @@ class GitHubReleaseDownloader:
         try:
             print(f"Starting download: {filename}")
             
-            headers = self.headers.copy()
+            headers = {}
             if use_api_url:
                 headers["Accept"] = "application/octet-stream"
             
-            with requests.get(download_url, headers=headers, stream=True) as response:
+            # Probe with a one-byte range to learn the size and whether the
+            # server honours Range requests
+            probe_headers = {**headers, "Range": "bytes=0-0"}
+            with self.session.get(download_url, headers=probe_headers, stream=True) as response:
                 response.raise_for_status()
-                
-                total_size = int(response.headers.get('content-length', 0))
-                downloaded_size = 0
-                
-                with open(file_path, 'wb') as file:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        if chunk:
-                            file.write(chunk)
-                            downloaded_size += len(chunk)
-                            
-                            # Show download progress
-                            if total_size > 0:
-                                progress = (downloaded_size / total_size) * 100
-                                print(f"\rProgress: {progress:.1f}%%", end="")
+                ranged = response.status_code == 206
+                # The total may be "*" when the server does not know the length
+                total = response.headers.get("content-range", "").rpartition("/")[2]
+                total_size = int(total) if total.isdigit() else 0
+                if not ranged:
+                    # Server ignored the Range header and is sending the whole file
+                    self._write_stream(response, file_path)
+
+            if ranged and total_size > 0:
+                self._download_ranges(download_url, headers, file_path, total_size)
+            elif ranged:
+                # Ranges are honoured but the size is unknown, so fetch it whole
+                with self.session.get(download_url, headers=headers, stream=True) as response:
+                    response.raise_for_status()
+                    self._write_stream(response, file_path)
             
             print(f"\nDownload completed successfully: {file_path}")
             return True
@@ -129,30 +324,185 @@ class GitHubReleaseDownloader:
         except Exception as e:
             self._set_error(f"Unexpected error: {e}")
             return False
+
+    def _write_stream(self, response: requests.Response, file_path: str) -> None:
+        """
+        Write a whole streamed response body to a file
+
+        Args:
+            response (Response): Streamed response
+            file_path (str): Destination file path
+        """
+        total_size = int(response.headers.get('content-length', 0))
+        response.raw.decode_content = True
+
+        with open(file_path, 'wb') as file:
+            preallocate_file(file.fileno(), total_size)
+            shutil.copyfileobj(ProgressReader(response.raw, total_size), file, DOWNLOAD_CHUNK_SIZE)
+            # Content-Length may not match the decoded size
+            file.truncate()
+            file.flush()
+            release_page_cache(file.fileno())
+
+    def _download_ranges(self, download_url: str, headers: Dict[str, str], file_path: str, total_size: int) -> None:
+        """
+        Download a file as DOWNLOAD_PARTS parallel Range requests
+
+        Args:
+            download_url (str): Download URL or API asset URL
+            headers (Dict): Extra request headers on top of the session defaults
+            file_path (str): Destination file path
+            total_size (int): Size of the file in bytes
+        """
+        part_size = -(-total_size // DOWNLOAD_PARTS)
+        ranges = [
+            (start, min(start + part_size, total_size) - 1)
+            for start in range(0, total_size, part_size)
+        ] if total_size > 0 else []
+
+        def fetch(start: int, end: int) -> None:
+            part_headers = {**headers, "Range": f"bytes={start}-{end}"}
+            with self.session.get(download_url, headers=part_headers, stream=True) as response:
+                response.raise_for_status()
+                if response.status_code != 206:
+                    raise requests.exceptions.HTTPError(
+                        f"Expected partial content for bytes {start}-{end}, got {response.status_code}"
+                    )
+                # Read into one reusable buffer instead of a new bytes per chunk
+                buffer = memoryview(bytearray(min(DOWNLOAD_CHUNK_SIZE, end + 1 - start)))
+                offset = start
+                while True:
+                    size = response.raw.readinto(buffer)
+                    if not size:
+                        break
+                    os.pwrite(fd, buffer[:size], offset)
+                    offset += size
+                if offset != end + 1:
+                    raise IOError(f"Incomplete download of bytes {start}-{end}")
+
+        fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            preallocate_file(fd, total_size)
+            with ThreadPoolExecutor(max_workers=DOWNLOAD_PARTS) as executor:
+                futures = [executor.submit(fetch, start, end) for start, end in ranges]
+                for done, future in enumerate(futures, 1):
+                    future.result()
+                    # Show download progress
+                    progress = (done / len(futures)) * 100
+                    print(f"\rProgress: {progress:.1f}%%", end="")
+            release_page_cache(fd)
+        finally:
+            os.close(fd)
     
+    @staticmethod
+    @contextmanager
+    def _open_tar_stream(fileobj: Any, archive_name: str) -> Iterator[tarfile.TarFile]:
+        """
+        Open a forward-only .tar.gz or .tar.zst stream
+
+        Args:
+            fileobj: Readable binary stream holding the compressed archive
+            archive_name (str): Archive file name, used to pick the decompressor
+
+        Yields:
+            TarFile: Archive opened in streaming mode
+        """
+        # Read the input in TAR_STREAM_BUFSIZE blocks rather than tarfile's
+        # default 10 KiB records
+        if archive_name.endswith(".tar.zst"):
+            import zstandard
+
+            dctx = zstandard.ZstdDecompressor()
+            with dctx.stream_reader(fileobj) as reader:
+                with tarfile.open(fileobj=reader, mode="r|", bufsize=TAR_STREAM_BUFSIZE) as tar:
+                    yield tar
+        else:
+            with tarfile.open(fileobj=fileobj, mode="r|gz", bufsize=TAR_STREAM_BUFSIZE) as tar:
+                yield tar
+
+    def _extract_stream(self, fileobj: Any, archive_name: str, extract_to: str) -> None:
+        """
+        Extract a forward-only .tar.gz or .tar.zst stream
+
+        Args:
+            fileobj: Readable binary stream holding the compressed archive
+            archive_name (str): Archive file name, used to pick the decompressor
+            extract_to (str): Directory to extract the contents to
+        """
+        with self._open_tar_stream(fileobj, archive_name) as tar:
+            # The "data" filter (Python 3.12, backported to 3.8.17+) rejects
+            # members that would escape extract_to
+            if hasattr(tarfile, "data_filter"):
+                tar.extractall(path=extract_to, filter="data")
+            else:
+                tar.extractall(path=extract_to)
+
+    @staticmethod
+    def _extraction_dir(download_path: str, archive_name: str) -> str:
+        """
+        Directory a release archive is extracted to
+        """
+        return os.path.join(download_path, re.sub(r"\.tar\.(gz|zst)$", "", archive_name))
+
     def extract_file(self, file_path: str, extract_to: str) -> bool:
         """
-        Extract a .tar.gz file to a specified directory
+        Extract a .tar.gz or .tar.zst file to a specified directory
 
         Args:
-            file_path (str): Path to the .tar.gz file
+            file_path (str): Path to the .tar.gz or .tar.zst file
             extract_to (str): Directory to extract the contents to
 
         Returns:
             bool: True if extraction is successful, False otherwise
         """
-        import tarfile
-
         try:
             print(f"Extracting {file_path} to {extract_to}")
-            with tarfile.open(file_path, "r:gz") as tar:
-                tar.extractall(path=extract_to)
+            # Read forward-only so gzip never has to seek back and re-decompress
+            with open(file_path, "rb") as file:
+                self._extract_stream(file, file_path, extract_to)
             print(f"Extraction completed successfully: {extract_to}")
             return True
         except Exception as e:
             self._set_error(f"Error extracting file: {e}")
             return False
 
+    def download_and_extract_file(self, download_url: str, filename: str, extract_to: str, use_api_url: bool = False) -> bool:
+        """
+        Extract a .tar.gz or .tar.zst file while it is being downloaded,
+        without writing the archive to disk
+
+        Args:
+            download_url (str): Download URL or API asset URL
+            filename (str): Archive file name
+            extract_to (str): Directory to extract the contents to
+            use_api_url (bool): Whether to use the API asset URL for authenticated download
+
+        Returns:
+            bool: True if successful, False if error
+        """
+        try:
+            print(f"Downloading and extracting {filename} to {extract_to}")
+
+            headers = {}
+            if use_api_url:
+                headers["Accept"] = "application/octet-stream"
+
+            with self.session.get(download_url, headers=headers, stream=True) as response:
+                response.raise_for_status()
+                # The archive decompressor handles the compressed bytes itself
+                response.raw.decode_content = False
+                self._extract_stream(response.raw, filename, extract_to)
+
+            print(f"Extraction completed successfully: {extract_to}")
+            return True
+
+        except requests.exceptions.RequestException as e:
+            self._set_error(f"Error downloading file: {e}")
+            return False
+        except Exception as e:
+            self._set_error(f"Error extracting file: {e}")
+            return False
+
     def download_latest_release(self, download_path: str = "./downloads") -> bool:
         """
         Download the latest release
@@ -187,55 +537,77 @@ class GitHubReleaseDownloader:
             use_api_url=True
         )
 
-    def download_and_extract_latest_release(self, download_path: str = "./downloads") -> bool:
+    def download_and_extract_latest_release(self, download_path: str = "./downloads", asset: Optional[Dict[str, Any]] = None) -> bool:
         """
         Download and extract the latest release
 
         Args:
             download_path (str): Directory to save and extract the file
+            asset (Dict, optional): Release asset already looked up by the caller
 
         Returns:
             bool: True if successful, False otherwise
         """
-        # Download the latest release
-        release_data = self.get_latest_release()
-        if not release_data:
-            return False
+        if asset is None:
+            release_data = self.get_latest_release()
+            if not release_data:
+                return False
 
-        asset = self.find_release_asset(release_data)
-        if not asset:
-            return False
+            asset = self.find_release_asset(release_data)
+            if not asset:
+                return False
 
-        if not self.download_file(
-            asset["url"],
-            asset["name"],
-            download_path,
-            use_api_url=True
-        ):
-            return False
+        # Determine the extraction directory
+        extract_to = self._extraction_dir(download_path, asset["name"])
+
+        # Download and extract the latest release in a single pass
+        return self.download_and_extract_file(asset["url"], asset["name"], extract_to, use_api_url=True)
 
-        # Determine the file path and extraction directory
-        file_name = asset["name"]
-        file_path = os.path.join(download_path, file_name)
-        extract_to = os.path.join(download_path, file_name.replace(".tar.gz", ""))
+    @staticmethod
+    def _list_remote_dirs(ftp: FTP, path: str) -> Set[str]:
+        """
+        List the names of the subdirectories of a remote directory
 
-        # Extract the file
-        return self.extract_file(file_path, extract_to)
+        Falls back to NLST, which also returns file names, on servers
+        without MLSD support.
 
-    def upload_to_ftp(self, local_path: str, remote_path: str) -> bool:
+        Args:
+            ftp (FTP): Logged-in FTP connection
+            path (str): Remote directory to list
+
+        Returns:
+            Set: Subdirectory names
         """
-        Upload files to an FTP server
+        try:
+            return {name for name, facts in ftp.mlsd(path, facts=["type"]) if facts.get("type") == "dir"}
+        except error_perm:
+            pass
+        try:
+            return {name.rsplit("/", 1)[-1] for name in ftp.nlst(path)}
+        except error_perm:
+            # Some servers answer NLST of an empty directory with 550
+            return set()
+
+    def _upload_to_ftp(self, remote_path: str, produce: Callable[[Callable[[str], None], Callable[[Any, str], None]], Optional[Dict[str, str]]]) -> bool:
+        """
+        Upload files over a pool of FTP sessions
+
+        ``produce`` is called with ``make_dir(dir_path)``, which creates a
+        remote directory and its missing parents, and ``add_file(source,
+        remote_file_path)``, which queues a local file path or a readable
+        binary file object for upload. It may return a mapping of remote
+        file paths to already uploaded remote files they should be copied
+        from once every queued file is on the server. Remote paths are
+        relative to remote_path and use forward slashes.
 
         Args:
-            local_path (str): Path to the local directory to upload
             remote_path (str): Path to the remote directory on the FTP server
+            produce (Callable): Callback feeding directories and files
 
         Returns:
             bool: True if upload is successful, False otherwise
         """
         # Load environment variables
-        
-
         ftp_host = os.getenv("FTP_HOST")
         ftp_user = os.getenv("FTP_USER")
         ftp_password = os.getenv("FTP_PASSWORD")
@@ -246,9 +618,14 @@ class GitHubReleaseDownloader:
 
         try:
             print(f"Connecting to FTP server: {ftp_host}")
-            ftp = FTP(ftp_host)
+            ftp = FTP(ftp_host, timeout=FTP_TIMEOUT)
             ftp.login(ftp_user, ftp_password)
 
+            # Remote subdirectory names per existing remote directory,
+            # keyed by path relative to remote_path
+            existing_dirs: Dict[str, Set[str]] = {}
+            created_dirs: Set[str] = set()
+
             # Ensure the remote directory exists
             try:
                 ftp.cwd(remote_path)
@@ -256,26 +633,136 @@ class GitHubReleaseDownloader:
                 print(f"Creating remote directory: {remote_path}")
                 ftp.mkd(remote_path)
                 ftp.cwd(remote_path)
+                existing_dirs[""] = set()
 
-            # Upload files
-            for root, dirs, files in os.walk(local_path):
-                for dirname in dirs:
-                    dir_path = os.path.relpath(os.path.join(root, dirname), local_path).replace("\\", "/")
-                    print(dir_path)
+            def make_dir(dir_path: str) -> None:
+                # Directories are created on the control connection so the
+                # upload workers never race on MKD. A directory is only
+                # listed when it already existed and may hold the new one.
+                if not dir_path or dir_path in created_dirs:
+                    return
+                parent, _, dirname = dir_path.rpartition("/")
+                make_dir(parent)
+                if parent not in created_dirs:
+                    if parent not in existing_dirs:
+                        existing_dirs[parent] = self._list_remote_dirs(ftp, parent or ".")
+                    if dirname in existing_dirs[parent]:
+                        return
+                print(f"Creating remote directory: {dir_path}")
+                ftp.mkd(dir_path)
+                created_dirs.add(dir_path)
+
+            files_to_upload: "queue.Queue[Tuple[Any, str]]" = queue.Queue(maxsize=FTP_UPLOAD_WORKERS * 2)
+            failed = threading.Event()
+            done = threading.Event()
+
+            def add_file(source: Any, remote_file_path: str) -> None:
+                while True:
+                    if failed.is_set():
+                        raise RuntimeError("FTP upload aborted")
                     try:
-                        ftp.mkd(dir_path)
-                    except Exception as e:
-                        print(f"{e}")
+                        files_to_upload.put((source, remote_file_path), timeout=0.1)
+                        return
+                    except queue.Full:
+                        continue
+
+            # Upload workers that are connecting or connected
+            sessions_left = FTP_UPLOAD_WORKERS
+            sessions_lock = threading.Lock()
+
+            def upload_worker() -> None:
+                nonlocal sessions_left
+                worker_ftp: Optional[FTP] = None
+                try:
+                    worker_ftp = FTP(ftp_host, timeout=FTP_TIMEOUT)
+                    worker_ftp.login(ftp_user, ftp_password)
+                    worker_ftp.set_pasv(True)
+                    worker_ftp.cwd(remote_path)
+                except Exception as e:
+                    if worker_ftp is not None:
+                        worker_ftp.close()
+                    with sessions_lock:
+                        sessions_left -= 1
+                        others = sessions_left
+                    # A session the server refuses (e.g. 421 too many
+                    # connections) is fine while another one can do the work
+                    if others > 0 or (done.is_set() and files_to_upload.empty()):
+                        print(f"Could not open an upload session, continuing with {others}: {e}")
+                        return
+                    failed.set()
+                    raise
+
+                finished = False
+                try:
+                    while not failed.is_set():
+                        try:
+                            source, remote_file_path = files_to_upload.get(timeout=0.1)
+                        except queue.Empty:
+                            if done.is_set():
+                                break
+                            continue
+                        if isinstance(source, str):
+                            print(f"Uploading {source} to {remote_file_path}")
+                            with open(source, "rb") as file:
+                                worker_ftp.storbinary(f"STOR {remote_file_path}", file)
+                        else:
+                            print(f"Uploading {remote_file_path}")
+                            with source:
+                                worker_ftp.storbinary(f"STOR {remote_file_path}", source)
+                    worker_ftp.quit()
+                    finished = True
+                finally:
+                    with sessions_lock:
+                        sessions_left -= 1
+                    # Any other exit stops the producer, which would otherwise
+                    # wait forever for room in the queue
+                    if not finished:
+                        failed.set()
+                        worker_ftp.close()
+
+            # Upload files over a pool of FTP sessions while they are produced
+            produce_error: Optional[Exception] = None
+            copies: Optional[Dict[str, str]] = None
+            with ThreadPoolExecutor(max_workers=FTP_UPLOAD_WORKERS) as executor:
+                futures = [executor.submit(upload_worker) for _ in range(FTP_UPLOAD_WORKERS)]
+                try:
+                    copies = produce(make_dir, add_file)
+                    ftp.quit()
+                except Exception as e:
+                    failed.set()
+                    ftp.close()
+                    produce_error = e
+                finally:
+                    done.set()
+
+            # Close files left in the queue when the upload was aborted
+            while True:
+                try:
+                    source, _ = files_to_upload.get_nowait()
+                except queue.Empty:
+                    break
+                if not isinstance(source, str):
+                    source.close()
+
+            # A worker failure is the root cause of an aborted producer
+            for future in futures:
+                future.result()
+            if produce_error is not None:
+                raise produce_error
+
+            # FTP has no server-side copy, so read the source back and store it again
+            if copies:
+                ftp = FTP(ftp_host, timeout=FTP_TIMEOUT)
+                ftp.login(ftp_user, ftp_password)
+                ftp.cwd(remote_path)
+                for remote_file_path, source_path in copies.items():
+                    print(f"Copying {source_path} to {remote_file_path}")
+                    with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE) as spool:
+                        ftp.retrbinary(f"RETR {source_path}", spool.write)
+                        spool.seek(0)
+                        ftp.storbinary(f"STOR {remote_file_path}", spool)
+                ftp.quit()
 
-                for filename in files:
-                    file_path = os.path.join(root, filename)
-                    # Ensure paths use forward slashes
-                    remote_file_path = os.path.relpath(file_path, local_path).replace("\\", "/")
-                    print(f"Uploading {file_path} to {remote_file_path}")
-                    with open(file_path, "rb") as file:
-                        ftp.storbinary(f"STOR {remote_file_path}", file)
-
-            ftp.quit()
             print("Upload completed successfully.")
             return True
 
@@ -283,26 +770,147 @@ class GitHubReleaseDownloader:
             self._set_error(f"Error uploading to FTP: {e}")
             return False
 
+    def upload_to_ftp(self, local_path: str, remote_path: str) -> bool:
+        """
+        Upload files to an FTP server
+
+        Args:
+            local_path (str): Path to the local directory to upload
+            remote_path (str): Path to the remote directory on the FTP server
+
+        Returns:
+            bool: True if upload is successful, False otherwise
+        """
+        local_len = len(local_path.rstrip(os.sep + (os.altsep or ""))) + 1
+
+        def remote_prefix(root: str) -> str:
+            # Remote path of a walked directory, using forward slashes
+            rel_root = root[local_len:].replace(os.sep, "/")
+            return f"{rel_root}/" if rel_root else ""
+
+        def produce(make_dir: Callable[[str], None], add_file: Callable[[Any, str], None]) -> None:
+            # os.fwalk and dir_fd opens are only available on POSIX systems
+            if not hasattr(os, "fwalk"):
+                for root, dirs, files in os.walk(local_path):
+                    prefix = remote_prefix(root)
+                    for dirname in dirs:
+                        make_dir(prefix + dirname)
+                    for filename in files:
+                        add_file(os.path.join(root, filename), prefix + filename)
+                return
+
+            for root, dirs, files, dirfd in os.fwalk(local_path):
+                prefix = remote_prefix(root)
+
+                for dirname in dirs:
+                    make_dir(prefix + dirname)
+
+                for filename in files:
+                    # Open relative to the directory fd; the worker closes it
+                    file = os.fdopen(os.open(filename, os.O_RDONLY, dir_fd=dirfd), "rb")
+                    try:
+                        add_file(file, prefix + filename)
+                    except Exception:
+                        file.close()
+                        raise
+
+        return self._upload_to_ftp(remote_path, produce)
+
+    def upload_archive_to_ftp(self, fileobj: Any, archive_name: str, remote_path: str) -> bool:
+        """
+        Upload the contents of a .tar.gz or .tar.zst stream to an FTP server
+        without extracting it to disk
+
+        Args:
+            fileobj: Readable binary stream holding the compressed archive
+            archive_name (str): Archive file name, used to pick the decompressor
+            remote_path (str): Path to the remote directory on the FTP server
+
+        Returns:
+            bool: True if upload is successful, False otherwise
+        """
+        def outside_release(path: str) -> bool:
+            return posixpath.isabs(path) or path == ".." or path.startswith("../")
+
+        def produce(make_dir: Callable[[str], None], add_file: Callable[[Any, str], None]) -> Dict[str, str]:
+            files: Set[str] = set()
+            dirs: Set[str] = set()
+            # Link members by name, with their target path inside the archive
+            links: Dict[str, str] = {}
+
+            with self._open_tar_stream(fileobj, archive_name) as tar:
+                for member in tar:
+                    name = posixpath.normpath(member.name)
+                    if outside_release(name):
+                        print(f"Skipping archive member outside the release: {member.name}")
+                        continue
+
+                    if member.isdir():
+                        if name != ".":
+                            make_dir(name)
+                            dirs.add(name)
+                    elif member.isfile():
+                        make_dir(posixpath.dirname(name))
+                        # The tar stream only moves forward, so each member is
+                        # buffered (in memory, or on disk when large) for its worker
+                        spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)
+                        shutil.copyfileobj(tar.extractfile(member), spool, DOWNLOAD_CHUNK_SIZE)
+                        spool.seek(0)
+                        add_file(spool, name)
+                        files.add(name)
+                    elif member.islnk() or member.issym():
+                        # Links cannot be read back from a forward-only stream;
+                        # they are uploaded as copies of their target instead
+                        make_dir(posixpath.dirname(name))
+                        if member.islnk():
+                            # Hard link names are relative to the archive root
+                            target = posixpath.normpath(member.linkname)
+                        elif posixpath.isabs(member.linkname):
+                            target = member.linkname
+                        else:
+                            target = posixpath.normpath(posixpath.join(posixpath.dirname(name), member.linkname))
+                        links[name] = target
+                    else:
+                        print(f"Skipping special archive member: {member.name}")
+
+            copies: Dict[str, str] = {}
+            for name, target in links.items():
+                # Follow chains of links, giving up on cycles
+                seen = {name}
+                while target in links and target not in seen:
+                    seen.add(target)
+                    target = links[target]
+
+                if target in files:
+                    copies[name] = target
+                elif target in dirs:
+                    print(f"Skipping link to directory: {name} -> {target}")
+                elif outside_release(target):
+                    raise ValueError(f"Archive link {name} points outside the release: {target}")
+                else:
+                    raise ValueError(f"Archive link {name} points to a missing file: {target}")
+            return copies
+
+        return self._upload_to_ftp(remote_path, produce)
+
     def download_extract_and_upload(self, download_path: str = "./downloads", remote_path: str = None) -> bool:
         """
         Download, extract, and upload the latest release to an FTP server
 
+        The release archive is streamed from GitHub straight into the FTP
+        upload; neither the archive nor its contents are staged on disk.
+        Files are written to remote_path as they are read, so a truncated
+        or corrupt download, or any other failure midway, can leave
+        remote_path partially updated with files from the new release.
+
         Args:
-            download_path (str): Directory to save and extract the file
+            download_path (str): Unused, kept so existing positional calls
+                keep working; nothing is staged on disk
             remote_path (str): Remote directory on the FTP server
 
         Returns:
             bool: True if all steps are successful, False otherwise
         """
-        # Download and extract the latest release
-        if not self.download_and_extract_latest_release(download_path):
-            return False
-
-        # Prompt user for remote directory if not provided
-        if not remote_path:
-            remote_path = input("Enter the remote directory on the FTP server: ")
-
-        # Determine the extraction directory
         release_data = self.get_latest_release()
         if not release_data:
             return False
@@ -311,42 +919,76 @@ class GitHubReleaseDownloader:
         if not asset:
             return False
 
-        file_name = asset["name"]
-        extract_to = os.path.join(download_path, file_name.replace(".tar.gz", ""))
+        # Prompt user for remote directory if not provided
+        if not remote_path:
+            remote_path = input("Enter the remote directory on the FTP server: ")
 
-        # Upload to FTP
-        success = self.upload_to_ftp(extract_to, remote_path)
+        if self.is_deployed(remote_path):
+            print(f"Release {release_data['tag_name']} is already deployed to {remote_path}")
+            return True
 
-        # Remove the tar.gz file and extracted directory after successful upload
-        if success:
-            # Determine the file path and extraction directory
-            file_path = os.path.join(download_path, file_name)
-            
-            # Remove the tar.gz file
-            try:
-                os.remove(file_path)
-                print(f"Deleted file: {file_path}")
-            except Exception as e:
-                self._set_error(f"Error deleting file {file_path}: {e}")
+        try:
+            print(f"Downloading {asset['name']} and uploading its contents to {remote_path}")
+            headers = {"Accept": "application/octet-stream"}
+            with self.session.get(asset["url"], headers=headers, stream=True) as response:
+                response.raise_for_status()
+                # The archive decompressor handles the compressed bytes itself
+                response.raw.decode_content = False
+                success = self.upload_archive_to_ftp(response.raw, asset["name"], remote_path)
+        except requests.exceptions.RequestException as e:
+            self._set_error(f"Error downloading file: {e}")
+            return False
 
-            # Remove the extracted directory
-            try:
-                shutil.rmtree(extract_to)
-                print(f"Deleted directory: {extract_to}")
-            except Exception as e:
-                self._set_error(f"Error deleting directory {extract_to}: {e}")
+        if not success:
+            self._set_error(
+                f"{self.last_error} - files uploaded before the failure were kept, "
+                f"so {remote_path} may be partially updated"
+            )
+
+        # Remember the deployment so an unchanged release is not uploaded again
+        if success:
+            deployed = {"tag_name": release_data["tag_name"], "asset_id": asset["id"]}
+            self._update_release_state(lambda entry: entry.setdefault("deployed", {}).update({remote_path: deployed}))
 
         return success
 
 
 app = Flask(__name__)
 
+# Background executor for deployments, so requests return immediately
+executor = ThreadPoolExecutor(max_workers=int(os.getenv('JOB_WORKERS', '4')))
+# Number of finished jobs whose outcome is kept for GET /jobs/<job_id>
+MAX_FINISHED_JOBS = int(os.getenv('MAX_FINISHED_JOBS', '1000'))
+# Jobs by id: {'future': Future} while pending, then {'success': bool, 'details': str}
+JOBS: Dict[str, Dict[str, Any]] = {}
+# Ids of finished jobs, oldest first, for evicting them from JOBS
+FINISHED_JOBS: Deque[str] = deque()
+_jobs_lock = threading.Lock()
+
+
+def finish_job(job_id: str, downloader: GitHubReleaseDownloader, future: Future) -> None:
+    """
+    Record the outcome of a finished job and release its downloader
+    """
+    downloader.session.close()
+    error = future.exception()
+    outcome = {
+        'success': error is None and bool(future.result()),
+        'details': str(error) if error else downloader.last_error or 'Unknown error'
+    }
+
+    with _jobs_lock:
+        JOBS[job_id] = outcome
+        FINISHED_JOBS.append(job_id)
+        while len(FINISHED_JOBS) > MAX_FINISHED_JOBS:
+            JOBS.pop(FINISHED_JOBS.popleft(), None)
+
+
 @app.route('/download-extract-upload', methods=['POST'])
 def download_extract_upload():
     data = request.get_json(silent=True) or {}
     if not data.get('api_key') or data.get('api_key') != os.getenv('APIKEY'):
         return jsonify({'error': 'API key is invalid or missing'}), 403
-    download_path = './downloads'
     github_token = os.getenv('GITHUB_TOKEN')
     repo_name = data.get('repo_name')
     remote_path = data.get('remote_path')
@@ -354,16 +996,39 @@ def download_extract_upload():
     if not repo_name or not github_token or not remote_path:
         return jsonify({'error': 'repo_name, github_token, and remote_path are required'}), 400
 
+    job_id = uuid.uuid4().hex
     downloader = GitHubReleaseDownloader(repo_name, github_token)
-    success = downloader.download_extract_and_upload(download_path, remote_path)
+    future = executor.submit(downloader.download_extract_and_upload, remote_path=remote_path)
+    with _jobs_lock:
+        JOBS[job_id] = {'future': future}
+    future.add_done_callback(functools.partial(finish_job, job_id, downloader))
+
+    return jsonify({'job_id': job_id, 'status': 'queued'}), 202
+
+
+@app.route('/jobs/<job_id>', methods=['GET'])
+def job_status(job_id):
+    with _jobs_lock:
+        job = JOBS.get(job_id)
+    if not job:
+        return jsonify({'error': 'Job not found'}), 404
+
+    if 'future' in job:
+        status = 'running' if job['future'].running() else 'queued'
+        return jsonify({'job_id': job_id, 'status': status}), 200
 
-    if success:
-        return jsonify({'message': 'Download, extraction, and upload completed successfully'}), 200
-    else:
+    if job['success']:
         return jsonify({
-            'error': 'Operation failed',
-            'details': downloader.last_error or 'Unknown error'
-        }), 500
+            'job_id': job_id,
+            'status': 'completed',
+            'message': 'Download, extraction, and upload completed successfully'
+        }), 200
+    return jsonify({
+        'job_id': job_id,
+        'status': 'failed',
+        'error': 'Operation failed',
+        'details': job['details']
+    }), 200
 
 if __name__ == '__main__':
     app.run(debug=True)